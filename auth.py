@@ -2,13 +2,37 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 
+# Authenticated services keyed by token file, so repeat authentications
+# for the same account within one run reuse the service and its pooled
+# transport instead of reloading and rebuilding.
+_service_cache: Dict[str, Any] = {}
+
+
+def build_gmail_service(creds: Credentials) -> Any:
+    """Build a Gmail service over an explicit keep-alive HTTP transport.
+
+    One AuthorizedHttp wrapping a single httplib2.Http is attached to the
+    service, so every API call for the account reuses the same pooled
+    connection instead of paying a fresh TCP+TLS handshake.
+
+    Args:
+        creds: Valid OAuth credentials
+
+    Returns:
+        Authenticated Gmail service object
+    """
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=30))
+    return build('gmail', 'v1', http=http)
+
 
 def load_token(token_path: Path, context: str = "") -> Optional[Credentials]:
     """Load credentials from a token file.
@@ -102,13 +126,19 @@ def authenticate_gmail() -> Any:
     token_path = Path('token.json')
     credentials_path = Path('credentials.json')
 
+    cached = _service_cache.get(str(token_path))
+    if cached is not None:
+        return cached
+
     creds = load_token(token_path)
 
     if not creds or not creds.valid:
         creds = refresh_or_create_credentials(creds, credentials_path)
         save_token(creds, token_path)
 
-    return build('gmail', 'v1', credentials=creds)
+    service = build_gmail_service(creds)
+    _service_cache[str(token_path)] = service
+    return service
 
 
 def authenticate_gmail_account(account_config: Dict[str, Any]) -> Any:
@@ -127,13 +157,19 @@ def authenticate_gmail_account(account_config: Dict[str, Any]) -> Any:
     token_file = Path(account_config.get('token_file', ''))
     email = account_config.get('email', 'unknown')
 
+    cached = _service_cache.get(str(token_file))
+    if cached is not None:
+        return cached
+
     creds = load_token(token_file, email)
 
     if not creds or not creds.valid:
         creds = refresh_or_create_credentials(creds, credentials_file, email)
         save_token(creds, token_file)
 
-    return build('gmail', 'v1', credentials=creds)
+    service = build_gmail_service(creds)
+    _service_cache[str(token_file)] = service
+    return service
 
 
 def authenticate_multiple_accounts(account_configs: list) -> Dict[str, Any]:
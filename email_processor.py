@@ -7,6 +7,7 @@ Handles HTML to Markdown conversion, quote removal, and content cleanup.
 
 import json
 import re
+from email.utils import parsedate_to_datetime
 from typing import Dict, Optional
 
 from bs4 import BeautifulSoup
@@ -185,7 +186,6 @@ def format_frontmatter(email_data: Dict, download_images: bool = False) -> str:
 
     # Parse and format date for better sorting
     try:
-        from email.utils import parsedate_to_datetime
         dt = parsedate_to_datetime(email_data['date'])
         lines.append(f"date_parsed: {dt.isoformat()}")
     except (ValueError, TypeError):
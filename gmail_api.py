@@ -6,8 +6,42 @@ Handles fetching emails, headers, and content from Gmail API.
 """
 
 import base64
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+from googleapiclient.discovery import build
+
+logger = logging.getLogger("gmail_to_md")
+
+# Gmail's batch endpoint accepts up to 100 operations per request.
+BATCH_SIZE = 100
+
+# Worker threads used to download attachment bodies in parallel.
+ATTACHMENT_WORKERS = 8
+
+_thread_services = threading.local()
+
+
+def _service_for_thread(service: Any) -> Any:
+    """Return a Gmail service safe to use on the current thread.
+
+    httplib2 transports are not thread-safe, so each worker thread
+    builds its own service from the shared credentials (static API
+    discovery makes this a cheap local operation). Falls back to the
+    given service when the credentials cannot be recovered from it.
+    """
+    creds = getattr(getattr(service, '_http', None), 'credentials', None)
+    if creds is None:
+        return service
+
+    cached = getattr(_thread_services, 'service', None)
+    if cached is None:
+        cached = build('gmail', 'v1', credentials=creds)
+        _thread_services.service = cached
+    return cached
+
 
 def fetch_email_ids(
     service: Any,
@@ -53,7 +87,7 @@ def fetch_email_ids(
         return email_ids
 
     except Exception as e:
-        print(f"Error fetching email list: {e}")
+        logger.warning(f"Error fetching email list: {e}")
         return []
 
 
@@ -93,14 +127,15 @@ def fetch_email_headers(service: Any, email_id: str) -> Optional[Dict[str, Any]]
         return email_data
 
     except Exception as e:
-        print(f"Error fetching headers for {email_id}: {e}")
+        logger.warning(f"Error fetching headers for {email_id}: {e}")
         return None
 
 
 def fetch_email_content(
     service: Any,
     email_id: str,
-    download_attachments: bool = False
+    download_attachments: bool = False,
+    size_limit_mb: Optional[int] = None
 ) -> Optional[Dict[str, Any]]:
     """Fetch full email content with optional attachment data.
 
@@ -108,6 +143,7 @@ def fetch_email_content(
         service: Gmail API service object
         email_id: Gmail message ID
         download_attachments: Whether to download attachment data
+        size_limit_mb: Skip downloading attachments larger than this
 
     Returns:
         Dict with email headers, body, attachments, and inline images
@@ -116,7 +152,37 @@ def fetch_email_content(
         msg = service.users().messages().get(
             userId='me', id=email_id, format='full'
         ).execute()
+    except Exception as e:
+        logger.warning(f"Error fetching email {email_id}: {e}")
+        return None
+
+    return parse_email_message(
+        msg, email_id, service, download_attachments, size_limit_mb=size_limit_mb
+    )
+
+
+def parse_email_message(
+    msg: Dict,
+    email_id: str,
+    service: Any = None,
+    download_attachments: bool = False,
+    executor: Optional[ThreadPoolExecutor] = None,
+    size_limit_mb: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Parse a full-format Gmail message resource into an email data dict.
+
+    Args:
+        msg: Message resource as returned by messages().get(format='full')
+        email_id: Gmail message ID
+        service: Gmail API service object (needed for attachment downloads)
+        download_attachments: Whether to download attachment data
+        executor: Optional thread pool for parallel attachment downloads
+        size_limit_mb: Skip downloading attachments larger than this
 
+    Returns:
+        Dict with email headers, body, attachments, and inline images
+    """
+    try:
         payload = msg['payload']
         headers = payload.get('headers', [])
 
@@ -140,24 +206,109 @@ def fetch_email_content(
             if key:
                 email_data[key] = header['value']
 
-        # Extract body and attachments
-        _extract_body_from_payload(payload, email_data, service, email_id, download_attachments)
+        # Extract body and queue attachment/inline-image downloads
+        pending = []
+        _extract_body_from_payload(payload, email_data, download_attachments, pending, size_limit_mb)
+
+        if pending and service and email_id:
+            _resolve_pending_attachments(service, email_id, pending, executor)
 
         return email_data
 
     except Exception as e:
-        print(f"Error fetching email {email_id}: {e}")
+        logger.warning(f"Error parsing email {email_id}: {e}")
         return None
 
 
+def fetch_email_contents_batch(
+    service: Any,
+    email_ids: List[str],
+    download_attachments: bool = False,
+    size_limit_mb: Optional[int] = None
+):
+    """Fetch full content for many emails using batched HTTP requests.
+
+    Chunks the ids into groups of up to BATCH_SIZE and retrieves each
+    group in a single HTTP round trip via BatchHttpRequest, instead of
+    one round trip per message. Ids that fail inside a batch are retried
+    with an individual get so one bad message doesn't sink its chunk.
+
+    Args:
+        service: Gmail API service object
+        email_ids: Gmail message IDs to fetch
+        download_attachments: Whether to download attachment data
+        size_limit_mb: Skip downloading attachments larger than this
+
+    Yields:
+        (email_id, email_data) tuples in the original order, with
+        email_data None when a message could not be fetched
+    """
+    executor = ThreadPoolExecutor(max_workers=ATTACHMENT_WORKERS) if download_attachments else None
+    # Single worker that fetches chunk N+1 while the caller is still
+    # parsing and saving chunk N, overlapping network wait with disk I/O
+    prefetcher = ThreadPoolExecutor(max_workers=1)
+
+    def _fetch_chunk(chunk):
+        chunk_service = _service_for_thread(service)
+        responses = {}
+
+        def _on_message(request_id, response, exception):
+            if exception is None:
+                responses[request_id] = response
+
+        batch = chunk_service.new_batch_http_request(callback=_on_message)
+        for email_id in chunk:
+            batch.add(
+                chunk_service.users().messages().get(
+                    userId='me', id=email_id, format='full'
+                ),
+                request_id=email_id
+            )
+
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.warning(f"Error executing batch fetch: {e}")
+
+        return responses
+
+    try:
+        chunks = [email_ids[i:i + BATCH_SIZE] for i in range(0, len(email_ids), BATCH_SIZE)]
+        future = prefetcher.submit(_fetch_chunk, chunks[0]) if chunks else None
+
+        for idx, chunk in enumerate(chunks):
+            responses = future.result()
+            if idx + 1 < len(chunks):
+                future = prefetcher.submit(_fetch_chunk, chunks[idx + 1])
+
+            for email_id in chunk:
+                msg = responses.get(email_id)
+                if msg is None:
+                    yield email_id, fetch_email_content(
+                        service, email_id, download_attachments, size_limit_mb
+                    )
+                else:
+                    yield email_id, parse_email_message(
+                        msg, email_id, service, download_attachments, executor, size_limit_mb
+                    )
+    finally:
+        prefetcher.shutdown()
+        if executor is not None:
+            executor.shutdown()
+
+
 def _extract_body_from_payload(
     payload: Dict,
     email_data: Dict,
-    service: Any = None,
-    email_id: str = None,
-    download_attachments: bool = False
+    download_attachments: bool,
+    pending: List,
+    size_limit_mb: Optional[int] = None
 ) -> None:
-    """Recursively extract body content, attachments, and inline images from email payload."""
+    """Recursively extract body content, attachments, and inline images from email payload.
+
+    Attachment/inline-image bodies are not fetched here; they are queued
+    on `pending` for _resolve_pending_attachments to download afterwards.
+    """
     if 'parts' in payload:
         for part in payload['parts']:
             mime_type = part.get('mimeType', '')
@@ -189,11 +340,15 @@ def _extract_body_from_payload(
                     part['body']['data']
                 ).decode('utf-8', errors='ignore')
             elif mime_type.startswith('multipart/'):
-                _extract_body_from_payload(part, email_data, service, email_id, download_attachments)
-            elif is_inline and download_attachments and service and email_id:
-                _download_inline_image(part, content_id, mime_type, service, email_id, email_data)
+                _extract_body_from_payload(
+                    part, email_data, download_attachments, pending, size_limit_mb
+                )
+            elif is_inline and download_attachments:
+                _queue_inline_image(part, content_id, mime_type, email_data, pending)
             elif 'filename' in part:
-                _handle_attachment(part, mime_type, service, email_id, download_attachments, email_data)
+                _handle_attachment(
+                    part, mime_type, download_attachments, email_data, pending, size_limit_mb
+                )
 
     elif 'body' in payload and 'data' in payload['body']:
         # Single part message
@@ -208,40 +363,34 @@ def _extract_body_from_payload(
             email_data['body_plain'] = content
 
 
-def _download_inline_image(
+def _queue_inline_image(
     part: Dict,
     content_id: str,
     mime_type: str,
-    service: Any,
-    email_id: str,
-    email_data: Dict
+    email_data: Dict,
+    pending: List
 ) -> None:
-    """Download inline image and add to email_data."""
+    """Register an inline image and queue its body for download."""
     attachment_id = part['body'].get('attachmentId')
     if not attachment_id:
         return
 
-    try:
-        att = service.users().messages().attachments().get(
-            userId='me', messageId=email_id, id=attachment_id
-        ).execute()
-
-        email_data['inline_images'][content_id] = {
-            'data': att['data'],
-            'mimeType': mime_type,
-            'filename': part.get('filename', f'{content_id}.{mime_type.split("/")[1]}')
-        }
-    except Exception as e:
-        print(f"Error downloading inline image {content_id}: {e}")
+    image_info = {
+        'mimeType': mime_type,
+        'size': part['body'].get('size', 0),
+        'filename': part.get('filename', f'{content_id}.{mime_type.split("/")[1]}')
+    }
+    email_data['inline_images'][content_id] = image_info
+    pending.append((attachment_id, image_info, f"inline image {content_id}"))
 
 
 def _handle_attachment(
     part: Dict,
     mime_type: str,
-    service: Any,
-    email_id: str,
     download_attachments: bool,
-    email_data: Dict
+    email_data: Dict,
+    pending: List,
+    size_limit_mb: Optional[int] = None
 ) -> None:
     """Handle email attachment."""
     attachment_info = {
@@ -251,13 +400,48 @@ def _handle_attachment(
         'attachmentId': part['body'].get('attachmentId')
     }
 
-    if download_attachments and service and email_id and attachment_info['attachmentId']:
-        try:
-            att = service.users().messages().attachments().get(
-                userId='me', messageId=email_id, id=attachment_info['attachmentId']
-            ).execute()
-            attachment_info['data'] = att['data']
-        except Exception as e:
-            print(f"Error downloading attachment {attachment_info['filename']}: {e}")
+    # Don't download bodies the save path would reject anyway; the
+    # part metadata already carries the size.
+    within_limit = (
+        size_limit_mb is None or
+        attachment_info['size'] <= size_limit_mb * 1024 * 1024
+    )
+
+    if download_attachments and attachment_info['attachmentId'] and within_limit:
+        pending.append((
+            attachment_info['attachmentId'],
+            attachment_info,
+            f"attachment {attachment_info['filename']}"
+        ))
 
     email_data['attachments'].append(attachment_info)
+
+
+def _fetch_attachment_data(service: Any, email_id: str, item) -> None:
+    """Download one queued attachment body into its info dict."""
+    attachment_id, info, description = item
+    try:
+        att = service.users().messages().attachments().get(
+            userId='me', messageId=email_id, id=attachment_id
+        ).execute()
+        info['data'] = att['data']
+    except Exception as e:
+        logger.warning(f"Error downloading {description}: {e}")
+
+
+def _resolve_pending_attachments(
+    service: Any,
+    email_id: str,
+    pending: List,
+    executor: Optional[ThreadPoolExecutor] = None
+) -> None:
+    """Download queued attachment bodies, in parallel when an executor is given."""
+    if executor is not None and len(pending) > 1:
+        def _fetch_on_worker(item):
+            _fetch_attachment_data(_service_for_thread(service), email_id, item)
+
+        # Consume the iterator so all downloads finish before returning
+        list(executor.map(_fetch_on_worker, pending))
+    else:
+        for item in pending:
+            _fetch_attachment_data(service, email_id, item)
@@ -8,7 +8,14 @@ Supports multiple Gmail accounts and Gmail's native search syntax.
 
 import argparse
 import datetime
+import json
+import logging
+import threading
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -17,9 +24,76 @@ from tqdm import tqdm
 from account_manager import AccountManager, setup_account_interactive
 from auth import authenticate_gmail, authenticate_gmail_account
 from email_processor import convert_to_markdown_content
-from gmail_api import fetch_email_content, fetch_email_headers, fetch_email_ids
-from image_utils import sanitize_filename, save_attachments, save_inline_images
-from oauth_setup import setup_oauth_for_account
+from gmail_api import fetch_email_contents_batch, fetch_email_headers, fetch_email_ids
+from image_utils import ensure_dir, sanitize_filename, save_attachments, save_inline_images
+
+logger = logging.getLogger("gmail_to_md")
+
+# Progress bars advance in batches of this many emails, so bar
+# bookkeeping and terminal redraws stay off the per-email path.
+PROGRESS_BATCH = 25
+
+# Sidecar file in the export directory recording which messages have
+# already been exported, so reruns resume instead of re-fetching.
+RESUME_CACHE_NAME = '.export_cache.json'
+
+_resume_lock = threading.Lock()
+
+
+def load_resume_cache(output_dir: Path) -> set:
+    """Load the set of already-exported message keys for an export directory.
+
+    Args:
+        output_dir: Export directory holding the cache sidecar
+
+    Returns:
+        Set of "account_email:message_id" keys (empty if no cache)
+    """
+    cache_file = output_dir / RESUME_CACHE_NAME
+    try:
+        return set(json.loads(cache_file.read_text()))
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+        return set()
+
+
+def update_resume_cache(output_dir: Path, new_keys: List[str]) -> None:
+    """Merge newly exported message keys into the on-disk cache.
+
+    Args:
+        output_dir: Export directory holding the cache sidecar
+        new_keys: Keys of messages exported this run
+    """
+    if not new_keys:
+        return
+
+    cache_file = output_dir / RESUME_CACHE_NAME
+    with _resume_lock:
+        # Re-read under the lock so concurrent accounts merge cleanly
+        merged = load_resume_cache(output_dir)
+        merged.update(new_keys)
+        cache_file.write_text(json.dumps(sorted(merged)))
+
+
+def setup_logging() -> QueueListener:
+    """Configure queue-based logging so worker threads never block on stdout.
+
+    Log records are enqueued by workers and drained by a single background
+    listener thread, avoiding stdout-lock contention during parallel work.
+
+    Returns:
+        Started QueueListener (caller must stop() it on exit)
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+
+    logger.setLevel(logging.INFO)
+    logger.addHandler(QueueHandler(log_queue))
+
+    return listener
 
 
 def parse_arguments():
@@ -160,6 +234,11 @@ More at: https://support.google.com/mail/answer/7190
         dest='test',
         help='Test mode: list emails that would be exported without actually exporting'
     )
+    output_group.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='Re-export emails already recorded in the resume cache'
+    )
     output_group.add_argument(
         '--keep-quotes',
         action='store_true',
@@ -216,7 +295,13 @@ def build_gmail_query(args) -> str:
     return ' '.join(query_parts)
 
 
-def run_test_mode(service, query: str, max_results: Optional[int], account_name: str = "") -> int:
+def run_test_mode(
+    service,
+    query: str,
+    max_results: Optional[int],
+    account_name: str = "",
+    position: int = 0
+) -> int:
     """Run in test mode - just list emails without exporting."""
     account_prefix = f"[{account_name}] " if account_name else ""
     print(f"\n{account_prefix}Testing query: \"{query}\"")
@@ -233,54 +318,60 @@ def run_test_mode(service, query: str, max_results: Optional[int], account_name:
     
     # Fetch headers for each email
     emails = []
-    with tqdm(total=len(email_ids), desc=f"{account_prefix}Fetching headers", unit="email") as pbar:
+    with tqdm(total=len(email_ids), desc=f"{account_prefix}Fetching headers", unit="email",
+              position=position) as pbar:
+        pending_ticks = 0
         for email_id in email_ids:
             email_data = fetch_email_headers(service, email_id)
             if email_data:
                 emails.append(email_data)
-            pbar.update(1)
-    
-    # Display results in a table format
-    print(f"\n{account_prefix}  Date                From                           To                             Subject")
-    print(f"{account_prefix}  " + "-"*100)
-    
+            pending_ticks += 1
+            if pending_ticks == PROGRESS_BATCH:
+                pbar.update(pending_ticks)
+                pending_ticks = 0
+        if pending_ticks:
+            pbar.update(pending_ticks)
+    
+    # Build the results table and emit it in a single write instead of
+    # one print (and stdout flush) per row
+    lines = [
+        f"\n{account_prefix}  Date                From                           To                             Subject",
+        f"{account_prefix}  " + "-"*100
+    ]
+
     for email in emails:
         # Parse and format date
         try:
-            from email.utils import parsedate_to_datetime
             dt = parsedate_to_datetime(email['date'])
             date_str = dt.strftime('%Y-%m-%d %H:%M')
         except:
             date_str = email['date'][:16] if email['date'] else 'Unknown'
-        
+
         # Truncate fields for display
         from_addr = email['from'][:28] + '...' if len(email['from']) > 31 else email['from']
         to_addr = email['to'][:28] + '...' if len(email['to']) > 31 else email['to']
         subject = email['subject'][:40] + '...' if len(email['subject']) > 43 else email['subject']
-        
-        print(f"{account_prefix}  {date_str:<18} {from_addr:<31} {to_addr:<31} {subject}")
-    
-    print(f"\n{account_prefix}{len(emails)} email(s) would be exported.")
+
+        lines.append(f"{account_prefix}  {date_str:<18} {from_addr:<31} {to_addr:<31} {subject}")
+
+    lines.append(f"\n{account_prefix}{len(emails)} email(s) would be exported.")
+    print('\n'.join(lines))
     
     return len(emails)
 
 
-def save_email_to_file(
+def plan_email_path(
     email_data: Dict,
-    markdown_content: str,
     output_dir: Path,
     filter_value: str,
     account_info: Optional[Dict] = None,
-    organize: bool = False,
-    download_images: bool = False,
-    image_size_limit_mb: int = 10
-) -> Tuple[Path, List[Path]]:
-    """Save email to organized file structure with optional image downloads.
+    organize: bool = False
+) -> Tuple[Path, Path]:
+    """Determine and reserve the destination path for an email.
 
     Returns:
-        Tuple of (email_file_path, list_of_saved_image_paths)
+        Tuple of (email_file_path, folder_path)
     """
-    from email.utils import parsedate_to_datetime
     from image_utils import get_unique_path
 
     # Parse date for filename
@@ -296,14 +387,39 @@ def save_email_to_file(
     else:
         folder_path = output_dir
 
-    folder_path.mkdir(parents=True, exist_ok=True)
+    ensure_dir(folder_path)
 
     # Create filename: YYYY-MM-DD_HH-MM-SS_subject.md
     timestamp = dt.strftime('%Y-%m-%d_%H-%M-%S')
     subject = sanitize_filename(email_data['subject'] or 'no_subject')
     file_path = get_unique_path(folder_path / f"{timestamp}_{subject}.md")
 
-    # Save images if requested
+    return file_path, folder_path
+
+
+def save_email_to_file(
+    email_data: Dict,
+    output_dir: Path,
+    filter_value: str,
+    account_info: Optional[Dict] = None,
+    organize: bool = False,
+    download_images: bool = False,
+    image_size_limit_mb: int = 10,
+    remove_quotes: bool = True
+) -> Tuple[Path, List[Path]]:
+    """Save email to organized file structure with optional image downloads.
+
+    Images are saved first so their local paths are known, then the
+    markdown is generated and written exactly once.
+
+    Returns:
+        Tuple of (email_file_path, list_of_saved_image_paths)
+    """
+    file_path, folder_path = plan_email_path(
+        email_data, output_dir, filter_value, account_info, organize
+    )
+
+    # Save images first so attachments/inline images carry local paths
     saved_images = []
     if download_images and (email_data.get('attachments') or email_data.get('inline_images')):
         email_base = file_path.stem
@@ -320,113 +436,143 @@ def save_email_to_file(
                 save_inline_images(email_data['inline_images'], inline_images_dir, folder_path)
             )
 
-    file_path.write_text(markdown_content, encoding='utf-8')
+    markdown_content = convert_to_markdown_content(
+        email_data, remove_quotes=remove_quotes, download_images=download_images
+    )
+    # Encode once and write the whole document in a single binary write,
+    # skipping the TextIOWrapper's incremental encoding
+    file_path.write_bytes(markdown_content.encode('utf-8'))
     return file_path, saved_images
 
 
-def process_single_account(service, args, account_info: Optional[Dict] = None) -> int:
-    """Process emails for a single account."""
+def process_single_account(
+    service,
+    args,
+    account_info: Optional[Dict] = None,
+    position: int = 0
+) -> int:
+    """Process emails for a single account.
+
+    Args:
+        service: Authenticated Gmail service object
+        args: Parsed command-line arguments
+        account_info: Account configuration dict (None in legacy mode)
+        position: tqdm row offset so concurrent accounts' bars stack
+    """
     account_name = account_info['nickname'] if account_info else ""
     account_prefix = f"[{account_name}] " if account_name else ""
-    
+
     # Build query
     query = build_gmail_query(args)
-    
+
     # Run test mode if requested
     if args.test:
-        return run_test_mode(service, query, args.max_emails, account_name)
+        return run_test_mode(service, query, args.max_emails, account_name, position)
     
     # Production mode
     filter_value = args.email or args.query or "export"
-    
-    print(f"\n{account_prefix}Searching for emails...")
-    print(f"{account_prefix}Query: {query}")
-    
+
+    print("\n" + account_prefix + "Searching for emails...")
+    print(account_prefix + "Query: " + query)
+
     # Fetch email IDs
     email_ids = fetch_email_ids(service, query, args.max_emails)
-    
+
     if not email_ids:
-        print(f"{account_prefix}No emails found matching the criteria.")
+        print(account_prefix + "No emails found matching the criteria.")
         return 0
-    
-    print(f"{account_prefix}Found {len(email_ids)} email(s) to export")
+
+    print(account_prefix + f"Found {len(email_ids)} email(s) to export")
     
     # Setup output directory
     output_dir = Path(args.output_dir)
-    output_dir.mkdir(exist_ok=True)
-    
+    ensure_dir(output_dir)
+
+    # Skip emails already exported to this directory in previous runs
+    account_email = account_info['email'] if account_info else ''
+    resume_keys = set() if args.no_resume else load_resume_cache(output_dir)
+    if resume_keys:
+        remaining = [eid for eid in email_ids if f"{account_email}:{eid}" not in resume_keys]
+        if len(remaining) < len(email_ids):
+            print(account_prefix + f"Skipping {len(email_ids) - len(remaining)} previously exported email(s)")
+        email_ids = remaining
+        if not email_ids:
+            print(account_prefix + "All matching emails already exported.")
+            return 0
+
     # Process emails
     successful = 0
     failed = 0
     saved_files = []
     saved_images_count = 0
+    exported_keys = []
     
     # Determine if we should download images
     download_images = args.download_images and not args.skip_images
     
-    desc = f"{account_prefix}Exporting emails" if account_name else "Exporting emails"
-    with tqdm(total=len(email_ids), desc=desc, unit="email") as pbar:
-        for email_id in email_ids:
-            # Fetch email content with optional attachment downloads
-            email_data = fetch_email_content(service, email_id, download_images)
-            
+    desc = account_prefix + "Exporting emails"
+    with tqdm(total=len(email_ids), desc=desc, unit="email", position=position) as pbar:
+        pending_ticks = 0
+        # Fetch email content in batched round trips, with optional
+        # attachment downloads
+        for email_id, email_data in fetch_email_contents_batch(
+            service, email_ids, download_images, size_limit_mb=args.image_size_limit
+        ):
             if email_data:
-                # Convert to markdown (needs to happen AFTER saving to get local paths)
-                # First save to get local paths for images
                 try:
-                    # Save email and images first to get paths
-                    temp_markdown = convert_to_markdown_content(
-                        email_data, remove_quotes=not args.keep_quotes, download_images=False
-                    )
-                    
+                    # Images are saved before the markdown is generated,
+                    # so local paths land in the one and only write
                     file_path, saved_images = save_email_to_file(
-                        email_data, temp_markdown, output_dir, 
+                        email_data, output_dir,
                         filter_value, account_info, organize=args.organize,
                         download_images=download_images,
-                        image_size_limit_mb=args.image_size_limit
+                        image_size_limit_mb=args.image_size_limit,
+                        remove_quotes=not args.keep_quotes
                     )
-                    
-                    # Now regenerate markdown with correct image paths
-                    if download_images and saved_images:
-                        markdown_content = convert_to_markdown_content(
-                            email_data, remove_quotes=not args.keep_quotes, download_images=True
-                        )
-                        # Rewrite the file with updated paths
-                        file_path.write_text(markdown_content, encoding='utf-8')
-                    
+
                     saved_files.append(file_path)
                     saved_images_count += len(saved_images)
+                    exported_keys.append(f"{account_email}:{email_id}")
                     successful += 1
                 except Exception as e:
-                    print(f"\n{account_prefix}Error saving email {email_id}: {str(e)}")
+                    logger.warning(f"{account_prefix}Error saving email {email_id}: {str(e)}")
                     failed += 1
             else:
                 failed += 1
             
-            pbar.update(1)
-    
+            pending_ticks += 1
+            if pending_ticks == PROGRESS_BATCH:
+                pbar.update(pending_ticks)
+                pending_ticks = 0
+        if pending_ticks:
+            pbar.update(pending_ticks)
+
+    if not args.no_resume:
+        update_resume_cache(output_dir, exported_keys)
+
     # Summary
-    print(f"\n{account_prefix}Export Complete!")
-    print(f"{account_prefix}Successfully exported: {successful} email(s)")
+    print("\n" + account_prefix + "Export Complete!")
+    print(account_prefix + f"Successfully exported: {successful} email(s)")
     if failed:
-        print(f"{account_prefix}Failed: {failed} email(s)")
+        print(account_prefix + f"Failed: {failed} email(s)")
     if saved_images_count > 0:
-        print(f"{account_prefix}Downloaded images: {saved_images_count}")
+        print(account_prefix + f"Downloaded images: {saved_images_count}")
     
-    if saved_files and account_info:
-        export_folder = saved_files[0].parent.parent.parent
-        print(f"{account_prefix}Files saved to: {export_folder}")
-    elif saved_files:
-        export_folder = saved_files[0].parent.parent
-        print(f"{account_prefix}Files saved to: {export_folder}")
+    if saved_files:
+        # The export root is already known; no need to walk parents of the
+        # first saved file (a leftover from the old dated-folder layout).
+        print(account_prefix + f"Files saved to: {output_dir}")
     
     return successful
 
 
 def handle_account_management(args, manager: AccountManager) -> int:
     """Handle account management commands."""
-    
+
     if args.setup_account:
+        # Only the setup commands need the OAuth machinery; keep it off
+        # the import path of ordinary export runs
+        from oauth_setup import setup_oauth_for_account
         nickname = setup_account_interactive(manager)
         if nickname:
             print(f"\nWould you like to set up OAuth credentials now? [Y/n]: ", end='')
@@ -453,6 +599,7 @@ def handle_account_management(args, manager: AccountManager) -> int:
         return 0
     
     if args.setup_oauth:
+        from oauth_setup import setup_oauth_for_account
         config = manager.get_account(args.setup_oauth)
         if not config:
             print(f"Account '{args.setup_oauth}' not found.")
@@ -475,7 +622,16 @@ def handle_account_management(args, manager: AccountManager) -> int:
 def main():
     """Main execution function."""
     args = parse_arguments()
-    
+
+    listener = setup_logging()
+    try:
+        return run(args)
+    finally:
+        listener.stop()
+
+
+def run(args) -> int:
+    """Run the export with parsed arguments."""
     # Initialize account manager
     manager = AccountManager()
     
@@ -526,34 +682,29 @@ def main():
         print("Error: Either --email or --query must be specified")
         return 1
     
-    # Process each selected account
+    # Authenticate serially first - the OAuth flow may need the browser
+    # and terminal, which doesn't mix with background threads.
+    authenticated = []
     total_exported = 0
     account_summaries = []
-    
+
     for nickname in selected_accounts:
         config = manager.get_account(nickname)
         if not config:
             print(f"\nWarning: Account '{nickname}' not found, skipping...")
             continue
-        
+
         # Add nickname to config for easier access
         config['nickname'] = nickname
-        
+
         try:
             print(f"\n{'='*60}")
             print(f"Processing account: {nickname} ({config['email']})")
             print('='*60)
-            
+
             service = authenticate_gmail_account(config)
-            exported = process_single_account(service, args, config)
-            total_exported += exported
-            
-            account_summaries.append({
-                'nickname': nickname,
-                'email': config['email'],
-                'exported': exported
-            })
-            
+            authenticated.append((nickname, config, service))
+
         except Exception as e:
             print(f"\nError processing account '{nickname}': {str(e)}")
             account_summaries.append({
@@ -562,6 +713,37 @@ def main():
                 'exported': 0,
                 'error': str(e)
             })
+
+    # Fan the per-account exports out to worker threads so accounts
+    # overlap their network waits instead of running back to back.
+    # Capped at 4: each account brings its own prefetcher and attachment
+    # workers, and past that point per-project API quota dominates.
+    if authenticated:
+        with ThreadPoolExecutor(max_workers=min(len(authenticated), 4)) as executor:
+            futures = [
+                executor.submit(process_single_account, service, args, config, idx)
+                for idx, (_, config, service) in enumerate(authenticated)
+            ]
+
+            for (nickname, config, _), future in zip(authenticated, futures):
+                try:
+                    exported = future.result()
+                    total_exported += exported
+
+                    account_summaries.append({
+                        'nickname': nickname,
+                        'email': config['email'],
+                        'exported': exported
+                    })
+
+                except Exception as e:
+                    print(f"\nError processing account '{nickname}': {str(e)}")
+                    account_summaries.append({
+                        'nickname': nickname,
+                        'email': config['email'],
+                        'exported': 0,
+                        'error': str(e)
+                    })
     
     # Final summary for multi-account export
     if len(selected_accounts) > 1:
@@ -6,10 +6,62 @@ Provides functions for saving attachments and inline images with
 duplicate handling and size limit enforcement.
 """
 
-import base64
+import hashlib
+import logging
+import os
+import re
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# pybase64 offers a SIMD-accelerated decoder with the same signature as the
+# stdlib; fall back to base64 when it is not installed.
+try:
+    from pybase64 import urlsafe_b64decode
+except ImportError:
+    from base64 import urlsafe_b64decode
+
+logger = logging.getLogger("gmail_to_md")
+
+# Single-pass character table for sanitize_filename: invalid filesystem
+# characters become underscores, control characters are dropped.
+_CHAR_TABLE = {ord(c): '_' for c in '<>:"/\\|?*'}
+_CHAR_TABLE.update(dict.fromkeys(range(0x20)))
+_CHAR_TABLE[0x7f] = None
+
+# Compiled once: sanitize_filename runs for every subject, attachment,
+# and inline image in an export.
+_SPACE_RUNS = re.compile(r'[_\s]+')
+
+# Names made purely of safe characters pass through untouched; one
+# fullmatch replaces the translate and substitution passes entirely.
+_CLEAN_NAME = re.compile(r'[^<>:"/\\|?*\x00-\x1f\x7f\s_]+')
+
+# Encoded-slice size for streaming base64 decodes; a multiple of 4 so
+# every slice decodes independently of its neighbors.
+DECODE_CHUNK = 1 << 20
+
+# Directories already created this run, so repeated saves into the same
+# attachment/inline-image folder skip the redundant mkdir syscalls.
+_created_dirs = set()
+
+# One lock guards every module-level cache below: the per-account
+# threads in gmail_to_markdown all plan paths in a shared export
+# directory, so reads and reservations must be atomic.
+_cache_lock = threading.Lock()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory (with parents) at most once per process.
+
+    Args:
+        path: Directory to create if not already seen
+    """
+    with _cache_lock:
+        if path not in _created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(path)
+
 
 def sanitize_filename(filename: str, max_length: int = 100) -> str:
     """Sanitize filename for filesystem.
@@ -21,14 +73,16 @@ def sanitize_filename(filename: str, max_length: int = 100) -> str:
     Returns:
         Sanitized filename safe for filesystem use
     """
-    import re
-
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove control characters
-    filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
+    # Fast path: typical attachment names (report.pdf, logo.png) need
+    # no rewriting at all
+    if (len(filename) <= max_length and not filename.endswith('.')
+            and _CLEAN_NAME.fullmatch(filename)):
+        return filename
+
+    # Replace invalid characters and strip control characters in one pass
+    filename = filename.translate(_CHAR_TABLE)
     # Replace multiple spaces/underscores
-    filename = re.sub(r'[_\s]+', '_', filename)
+    filename = _SPACE_RUNS.sub('_', filename)
     # Truncate if too long
     if len(filename) > max_length:
         filename = filename[:max_length]
@@ -38,28 +92,64 @@ def sanitize_filename(filename: str, max_length: int = 100) -> str:
     return filename if filename else 'untitled'
 
 
+# First saved path per content hash, so repeated attachments (the same
+# PDF carried through a whole thread, say) are hardlinked instead of
+# decoded and written again.
+_content_store = {}
+
+# Filenames per directory, scanned once and kept current as unique
+# paths are handed out, so collision probing needs no stat syscalls.
+_dir_names = {}
+
+
+def _names_in_dir(parent: Path) -> set:
+    """Get (and cache) the set of filenames in a directory.
+
+    Caller must hold _cache_lock.
+    """
+    names = _dir_names.get(parent)
+    if names is None:
+        try:
+            names = {entry.name for entry in os.scandir(parent)}
+        except FileNotFoundError:
+            names = set()
+        _dir_names[parent] = names
+    return names
+
+
 def get_unique_path(base_path: Path) -> Path:
     """Get a unique file path by adding counter suffix if needed.
 
+    The returned name is reserved in the per-directory cache, so the
+    caller is expected to create the file.
+
     Args:
         base_path: Desired file path
 
     Returns:
         Unique path (original or with counter suffix)
     """
-    if not base_path.exists():
-        return base_path
+    with _cache_lock:
+        names = _names_in_dir(base_path.parent)
+
+        name = base_path.name
+        if name not in names:
+            names.add(name)
+            return base_path
+
+        # Split name/extension once instead of re-parsing via stem/suffix.
+        stem, dot, ext = name.rpartition('.')
+        if not stem:
+            stem, dot, ext = name, '', ''
 
-    counter = 1
-    stem = base_path.stem
-    suffix = base_path.suffix
-    parent = base_path.parent
+        counter = 1
+        candidate = f"{stem}_{counter}{dot}{ext}"
+        while candidate in names:
+            counter += 1
+            candidate = f"{stem}_{counter}{dot}{ext}"
 
-    while True:
-        new_path = parent / f"{stem}_{counter}{suffix}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
+        names.add(candidate)
+        return base_path.parent / candidate
 
 
 def save_binary_file(
@@ -78,11 +168,44 @@ def save_binary_file(
         Path to saved file, or None on error
     """
     try:
-        file_data = base64.urlsafe_b64decode(data_b64)
-        dest_path.write_bytes(file_data)
+        # Hash the encoded payload (identical bytes encode identically),
+        # so duplicates are detected without decoding anything.
+        digest = hashlib.sha256(data_b64.encode('ascii', errors='ignore')).hexdigest()
+        with _cache_lock:
+            existing = _content_store.get(digest)
+        if existing is not None and existing.exists():
+            try:
+                dest_path.hardlink_to(existing)
+                return dest_path
+            except OSError:
+                # Filesystem without hardlinks; fall through to a real write
+                pass
+
+        # Unbuffered handles: decoded buffers reach the kernel directly
+        # without an intermediate BufferedWriter copy.
+        if len(data_b64) <= DECODE_CHUNK:
+            # Decode before opening, so a bad payload leaves no file
+            decoded = urlsafe_b64decode(data_b64)
+            with open(dest_path, 'wb', buffering=0) as f:
+                f.write(decoded)
+        else:
+            # Stream-decode large payloads so peak memory is one
+            # chunk instead of encoded + decoded copies of the file.
+            try:
+                with open(dest_path, 'wb', buffering=0) as f:
+                    for i in range(0, len(data_b64), DECODE_CHUNK):
+                        f.write(urlsafe_b64decode(data_b64[i:i + DECODE_CHUNK]))
+            except Exception:
+                # Don't leave a half-written file that looks like a
+                # successfully exported attachment
+                dest_path.unlink(missing_ok=True)
+                raise
+
+        with _cache_lock:
+            _content_store.setdefault(digest, dest_path)
         return dest_path
     except Exception as e:
-        print(f"Error saving {description}: {str(e)}")
+        logger.warning(f"Error saving {description}: {str(e)}")
         return None
 
 
@@ -114,7 +237,7 @@ def save_image_file(
     if size_mb > size_limit_mb:
         return None, None
 
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(dest_dir)
 
     filename = sanitize_filename(image_info.get('filename', 'unnamed'))
     dest_path = get_unique_path(dest_dir / filename)
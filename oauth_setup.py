@@ -9,40 +9,252 @@ Provides multiple methods for setting up OAuth credentials:
 """
 
 import json
+import os
+import random
+import re
 import shlex
 import shutil
 import subprocess
+import sys
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+# orjson decodes JSON straight from bytes several times faster than the
+# stdlib; fall back to json.loads when it is not installed. Both raise
+# ValueError subclasses on malformed input.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Validation results keyed by (inode, mtime_ns, size), so repeatedly
+# validating an unchanged credentials file costs one stat call instead
+# of a read and a JSON parse.
+_VALIDATE_CACHE: Dict[Tuple[int, int, int], bool] = {}
+
+# Parsed credentials JSON keyed by absolute path, so the copy-then-
+# validate flow parses each file once instead of three times.
+_parsed_cache: Dict[str, Tuple[int, dict]] = {}
+
+
+def _load_credentials_json(path: str) -> dict:
+    """Load and parse a JSON file, cached by path and mtime.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON dict (shared; callers must not mutate it)
+    """
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    cached = _parsed_cache.get(abs_path)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
+    with open(abs_path, 'rb') as f:
+        data = _json_loads(f.read())
+    _parsed_cache[abs_path] = (st.st_mtime_ns, data)
+    return data
+
+# Project-ID sanitization, compiled once: dots and underscores become
+# hyphens, runs of hyphens collapse to one.
+_SANITIZE_TABLE = str.maketrans('._', '--')
+_DASH_RUNS = re.compile(r'-+')
+
+# Output markers for transient server-side failures that are worth a
+# local retry instead of restarting the whole interactive flow.
+_TRANSIENT_MARKERS = ('503', 'RESOURCE_EXHAUSTED', 'DEADLINE_EXCEEDED', 'Retry later')
+
+# Whitespace plus the quotes terminals add around drag-and-dropped
+# paths, stripped in a single pass.
+_PATH_STRIP_CHARS = ' \t\r\n"\''
+
+# Fields an OAuth client section must carry to be usable.
+_REQUIRED_FIELDS = frozenset({'client_id', 'client_secret', 'auth_uri', 'token_uri'})
+
+# Static guide text, emitted with a single write instead of dozens of
+# line-by-line prints (each of which locks and flushes stdout).
+_CONSOLE_GUIDE_TEMPLATE = """
+=== Google Cloud Console Setup Guide ===
+
+Setting up OAuth for account: {account_name} ({email})
+
+Follow these steps to set up OAuth credentials:
+
+1. CREATE A GOOGLE CLOUD PROJECT
+   - Go to: https://console.cloud.google.com/
+   - Click 'Select a project' → 'New Project'
+   - Name it: 'Gmail Export {title_name}'
+   - Click 'Create'
+
+2. ENABLE GMAIL API
+   - In the project dashboard, go to 'APIs & Services' → 'Library'
+   - Search for 'Gmail API'
+   - Click on it and press 'Enable'
+
+3. CONFIGURE OAUTH CONSENT SCREEN
+   - Go to 'APIs & Services' → 'OAuth consent screen'
+   - Choose 'External' (unless you have Google Workspace)
+   - Fill in:
+     • App name: Gmail Export {title_name}
+     • User support email: {email}
+     • Developer contact: {email}
+   - Click 'Save and Continue'
+   - On Scopes screen, click 'Add or Remove Scopes'
+   - Search for and select: {scope}
+   - Click 'Update' → 'Save and Continue'
+   - Add {email} as a test user
+   - Click 'Save and Continue'
+
+4. CREATE OAUTH CREDENTIALS
+   - Go to 'APIs & Services' → 'Credentials'
+   - Click 'Create Credentials' → 'OAuth client ID'
+   - Application type: 'Desktop app'
+   - Name: gmail-export-{account_name}
+   - Click 'Create'
+   - Click 'Download JSON'
+
+"""
+
+_OAUTH_CLIENT_GUIDE_TEMPLATE = """
+Step 4: Creating OAuth 2.0 credentials...
+
+Note: Creating desktop OAuth clients via gcloud requires additional steps.
+We'll guide you through the Google Cloud Console for this part.
+
+Please follow these steps:
+1. Open: https://console.cloud.google.com/apis/credentials?project={project_id}
+2. Click 'Create Credentials' → 'OAuth client ID'
+3. If prompted, configure the OAuth consent screen:
+   - App name: Gmail Export {title_name}
+   - User support email: {email}
+   - Add scope: {scope}
+4. For Application type, choose 'Desktop app'
+5. Name: gmail-export-{account_name}
+6. Click 'Create' and download the JSON file
+
+"""
 
 
 class OAuthSetup:
     """Handles OAuth credential setup for Gmail API access."""
     
     GMAIL_SCOPE = 'https://www.googleapis.com/auth/gmail.readonly'
-    
+
+    # Result of the gcloud probe, cached so repeated setup flows fork
+    # the (slow to start) gcloud CLI at most once.
+    _gcloud_available: Optional[bool] = None
+
+    # Auth state memoized per process: a gcloud launch costs ~0.5s and
+    # the active account only changes when this process switches it.
+    _auth_state: Optional[Tuple[str, list]] = None
+
+    @classmethod
+    def check_gcloud_installed(cls) -> bool:
+        """Check if gcloud CLI is installed and available (cached)."""
+        if cls._gcloud_available is None:
+            # A PATH scan is far cheaper than launching gcloud itself
+            if shutil.which('gcloud') is None:
+                cls._gcloud_available = False
+            else:
+                try:
+                    result = subprocess.run(
+                        ['gcloud', '--version'], capture_output=True, text=True, check=False
+                    )
+                    cls._gcloud_available = result.returncode == 0
+                except FileNotFoundError:
+                    cls._gcloud_available = False
+        return cls._gcloud_available
+
     @staticmethod
-    def check_gcloud_installed() -> bool:
-        """Check if gcloud CLI is installed and available."""
-        try:
-            result = subprocess.run(
-                ['gcloud', '--version'], capture_output=True, text=True, check=False
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+    def _project_id_for_account(account_name: str) -> str:
+        """Derive a valid Cloud project ID from an account nickname."""
+        sanitized_name = account_name.translate(_SANITIZE_TABLE).lower()
+        sanitized_name = _DASH_RUNS.sub('-', sanitized_name).strip('-')
+        # Project IDs must start with a letter
+        if sanitized_name and not sanitized_name[0].isalpha():
+            sanitized_name = 'g-' + sanitized_name
+        return f"gmail-export-{sanitized_name}"[:30]  # Max 30 chars
+
+    def _get_auth_state(self) -> Tuple[str, list]:
+        """Get the active gcloud account and all authenticated accounts.
+
+        Returns:
+            Tuple of (active_account, list_of_authenticated_accounts)
+        """
+        if OAuthSetup._auth_state is not None:
+            return OAuthSetup._auth_state
+
+        success, output = self.run_gcloud_command(['auth', 'list', '--format=json'])
+
+        current_account = ''
+        auth_accounts = []
+        if success:
+            # The output may carry stderr warnings around the JSON body
+            start, end = output.find('['), output.rfind(']')
+            if start != -1 and end > start:
+                try:
+                    for entry in json.loads(output[start:end + 1]):
+                        account = entry.get('account', '')
+                        auth_accounts.append(account)
+                        if entry.get('status') == 'ACTIVE':
+                            current_account = account
+                except json.JSONDecodeError:
+                    pass
+
+        OAuthSetup._auth_state = (current_account, auth_accounts)
+        return current_account, auth_accounts
 
     @staticmethod
-    def run_gcloud_command(command: str, capture: bool = True) -> Tuple[bool, str]:
-        """Run a gcloud command and return (success, output)."""
+    def run_gcloud_command(command, capture: bool = True) -> Tuple[bool, str]:
+        """Run a gcloud command and return (success, output).
+
+        Args:
+            command: Argument list, or a command string (shlex-split
+                only when it actually contains quoting)
+            capture: When False the command is a returncode-only probe;
+                output goes to /dev/null and no pipes or decoding happen
+        """
         try:
-            cmd = ['gcloud'] + shlex.split(command)
-            result = subprocess.run(cmd, capture_output=capture, text=True, check=False)
-            output = (result.stdout + result.stderr) if capture else ""
-            return result.returncode == 0, output
+            if isinstance(command, str):
+                args = shlex.split(command) if '"' in command or "'" in command \
+                    else command.split()
+            else:
+                args = list(command)
+            cmd = ['gcloud'] + args
+            if not capture:
+                result = subprocess.run(
+                    cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    check=False
+                )
+                return result.returncode == 0, ""
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            return result.returncode == 0, result.stdout + result.stderr
         except Exception as e:
             return False, str(e)
     
+    def _run_with_retry(self, command, attempts: int = 3, base: float = 1.0) -> Tuple[bool, str]:
+        """Run a gcloud command, retrying transient failures with backoff.
+
+        Args:
+            command: Argument list passed to run_gcloud_command
+            attempts: Maximum number of tries
+            base: Initial backoff delay in seconds (doubles per retry)
+
+        Returns:
+            Tuple of (success, output) from the last attempt
+        """
+        success, output = self.run_gcloud_command(command)
+        for attempt in range(1, attempts):
+            if success or not any(marker in output for marker in _TRANSIENT_MARKERS):
+                break
+            delay = base * (2 ** (attempt - 1)) + random.random()
+            print(f"Transient gcloud failure, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+            success, output = self.run_gcloud_command(command)
+        return success, output
+
     def setup_with_gcloud(self, account_name: str, email: str) -> Optional[str]:
         """Set up OAuth using gcloud CLI."""
         print("\n=== gcloud CLI OAuth Setup ===\n")
@@ -50,8 +262,7 @@ class OAuthSetup:
         if not self.check_gcloud_installed():
             print("gcloud CLI is not installed.")
             print("Install it from: https://cloud.google.com/sdk/docs/install")
-            print("\nWould you like to use Web Console setup instead? [Y/n]: ", end='')
-            if input().strip().lower() != 'n':
+            if input("\nWould you like to use Web Console setup instead? [Y/n]: ").strip().lower() != 'n':
                 return self.setup_with_console_guide(account_name, email)
             return None
         
@@ -60,25 +271,25 @@ class OAuthSetup:
         print(f"Email: {email}")
         print()
         
+        project_id = self._project_id_for_account(account_name)
+
         # Step 1: Check authentication and switch to correct account
         print("Step 1: Checking gcloud authentication...")
-        
-        # Get current active account
-        success, current_account = self.run_gcloud_command('config get-value account')
-        current_account = current_account.strip()
-        
+        current_account, auth_accounts = self._get_auth_state()
+
         # Check if we need to switch accounts
-        if current_account != email:
+        switched = current_account != email
+        if switched:
             print(f"Current gcloud account: {current_account}")
             print(f"Target email: {email}")
-            
-            # Check if target email is already authenticated
-            success, auth_list = self.run_gcloud_command('auth list')
-            
-            if email in auth_list:
+
+            if email in auth_accounts:
                 print(f"Switching to account {email}...")
-                success, _ = self.run_gcloud_command(f'config set account {email}')
+                success, _ = self.run_gcloud_command(
+                    ['config', 'set', 'account', email], capture=False
+                )
                 if success:
+                    OAuthSetup._auth_state = None  # active account changed
                     print(f"Switched to {email}")
                 else:
                     print(f"Failed to switch to {email}")
@@ -90,8 +301,12 @@ class OAuthSetup:
                 print("\nPress Enter after authentication is complete...")
                 input()
                 
-                # Switch to the newly authenticated account
-                success, _ = self.run_gcloud_command(f'config set account {email}')
+                # Switch to the newly authenticated account; the login
+                # and switch both invalidate the memoized auth state
+                OAuthSetup._auth_state = None
+                success, _ = self.run_gcloud_command(
+                    ['config', 'set', 'account', email], capture=False
+                )
                 if not success:
                     print(f"Failed to switch to {email}")
                     return None
@@ -99,106 +314,68 @@ class OAuthSetup:
             print(f"Already using correct account: {email}")
         
         # Step 2: Create or select project
-        # Sanitize project ID: replace dots and underscores with hyphens, ensure valid format
-        sanitized_name = account_name.replace('.', '-').replace('_', '-').lower()
-        # Remove consecutive hyphens and ensure it starts with a letter
-        sanitized_name = '-'.join(filter(None, sanitized_name.split('-')))
-        if sanitized_name and not sanitized_name[0].isalpha():
-            sanitized_name = 'g-' + sanitized_name
-        project_id = f"gmail-export-{sanitized_name}"[:30]  # Max 30 chars
         print(f"\nStep 2: Setting up project...")
         print(f"  Project ID: {project_id}")
         print(f"  Display Name: Gmail Export")
-        
-        # Check if project exists
-        success, _ = self.run_gcloud_command(f"projects describe {project_id}")
-        
-        if not success:
-            print(f"Creating new project '{project_id}'...")
-            # Use a generic display name since project is already account-specific
-            success, output = self.run_gcloud_command(
-                f'projects create {project_id} --name="Gmail Export"'
-            )
-            if not success:
-                print(f"Failed to create project: {output}")
-                print("\nYou may need to:")
-                print("1. Enable billing for your Google Cloud account")
-                print("2. Use a different project ID if it already exists")
-                return None
+
+        # One idempotent create instead of a describe probe followed by
+        # a create - an existing project just reports ALREADY_EXISTS
+        print(f"Ensuring project '{project_id}' exists...")
+        # Use a generic display name since project is already account-specific
+        success, output = self._run_with_retry(
+            ['projects', 'create', project_id, '--name=Gmail Export']
+        )
+        if not success and 'ALREADY_EXISTS' not in output and 'already exists' not in output:
+            print(f"Failed to create project: {output}")
+            print("\nYou may need to:")
+            print("1. Enable billing for your Google Cloud account")
+            print("2. Use a different project ID if it already exists")
+            return None
         
         # Set as current project
         print(f"Setting '{project_id}' as current project...")
-        self.run_gcloud_command(f"config set project {project_id}")
+        self.run_gcloud_command(['config', 'set', 'project', project_id], capture=False)
         
         # Step 3: Enable Gmail API
         print("\nStep 3: Enabling Gmail API...")
-        success, output = self.run_gcloud_command(f"services enable gmail.googleapis.com")
-        if not success:
-            print(f"Failed to enable Gmail API: {output}")
-            print("\nYou may need to enable billing for this project.")
-            return None
-        
-        print("Gmail API enabled successfully!")
+        # Listing enabled services is a fast read; the enable mutation
+        # is a slow round trip even when it would be a no-op
+        success, output = self.run_gcloud_command([
+            'services', 'list', '--enabled',
+            '--filter=config.name:gmail.googleapis.com',
+            '--format=value(config.name)',
+        ])
+        if success and 'gmail.googleapis.com' in output:
+            print("Gmail API already enabled.")
+        else:
+            success, output = self._run_with_retry(['services', 'enable', 'gmail.googleapis.com'])
+            if not success:
+                print(f"Failed to enable Gmail API: {output}")
+                print("\nYou may need to enable billing for this project.")
+                return None
+
+            print("Gmail API enabled successfully!")
         
         # Step 4: Create OAuth client
-        print("\nStep 4: Creating OAuth 2.0 credentials...")
-        print("\nNote: Creating desktop OAuth clients via gcloud requires additional steps.")
-        print("We'll guide you through the Google Cloud Console for this part.")
-        print()
-        print("Please follow these steps:")
-        print(f"1. Open: https://console.cloud.google.com/apis/credentials?project={project_id}")
-        print("2. Click 'Create Credentials' → 'OAuth client ID'")
-        print("3. If prompted, configure the OAuth consent screen:")
-        print(f"   - App name: Gmail Export {account_name.title()}")
-        print(f"   - User support email: {email}")
-        print(f"   - Add scope: {self.GMAIL_SCOPE}")
-        print("4. For Application type, choose 'Desktop app'")
-        print(f"5. Name: gmail-export-{account_name}")
-        print("6. Click 'Create' and download the JSON file")
-        print()
-        
+        sys.stdout.write(_OAUTH_CLIENT_GUIDE_TEMPLATE.format(
+            project_id=project_id,
+            account_name=account_name,
+            title_name=account_name.title(),
+            email=email,
+            scope=self.GMAIL_SCOPE,
+        ))
+
         return self._get_credentials_file_path(account_name)
     
     def setup_with_console_guide(self, account_name: str, email: str) -> Optional[str]:
         """Guide user through Web Console setup."""
-        print("\n=== Google Cloud Console Setup Guide ===\n")
-        print(f"Setting up OAuth for account: {account_name} ({email})")
-        print()
-        print("Follow these steps to set up OAuth credentials:\n")
-        
-        print("1. CREATE A GOOGLE CLOUD PROJECT")
-        print("   - Go to: https://console.cloud.google.com/")
-        print("   - Click 'Select a project' → 'New Project'")
-        print(f"   - Name it: 'Gmail Export {account_name.title()}'")
-        print("   - Click 'Create'\n")
-        
-        print("2. ENABLE GMAIL API")
-        print("   - In the project dashboard, go to 'APIs & Services' → 'Library'")
-        print("   - Search for 'Gmail API'")
-        print("   - Click on it and press 'Enable'\n")
-        
-        print("3. CONFIGURE OAUTH CONSENT SCREEN")
-        print("   - Go to 'APIs & Services' → 'OAuth consent screen'")
-        print("   - Choose 'External' (unless you have Google Workspace)")
-        print("   - Fill in:")
-        print(f"     • App name: Gmail Export {account_name.title()}")
-        print(f"     • User support email: {email}")
-        print(f"     • Developer contact: {email}")
-        print("   - Click 'Save and Continue'")
-        print("   - On Scopes screen, click 'Add or Remove Scopes'")
-        print(f"   - Search for and select: {self.GMAIL_SCOPE}")
-        print("   - Click 'Update' → 'Save and Continue'")
-        print(f"   - Add {email} as a test user")
-        print("   - Click 'Save and Continue'\n")
-        
-        print("4. CREATE OAUTH CREDENTIALS")
-        print("   - Go to 'APIs & Services' → 'Credentials'")
-        print("   - Click 'Create Credentials' → 'OAuth client ID'")
-        print("   - Application type: 'Desktop app'")
-        print(f"   - Name: gmail-export-{account_name}")
-        print("   - Click 'Create'")
-        print("   - Click 'Download JSON'\n")
-        
+        sys.stdout.write(_CONSOLE_GUIDE_TEMPLATE.format(
+            account_name=account_name,
+            title_name=account_name.title(),
+            email=email,
+            scope=self.GMAIL_SCOPE,
+        ))
+
         return self._get_credentials_file_path(account_name)
     
     def setup_with_existing_file(self, account_name: str, source_path: str) -> Optional[str]:
@@ -211,13 +388,23 @@ class OAuthSetup:
         
         # Validate it's a valid OAuth credentials file
         try:
-            with open(source, 'r') as f:
-                data = json.load(f)
-                if 'installed' not in data and 'web' not in data:
-                    print("Error: Invalid OAuth credentials file format.")
-                    print("The file should contain 'installed' or 'web' application credentials.")
-                    return None
-        except json.JSONDecodeError:
+            raw = source.read_bytes()
+            # Cheap bytes-level sniff first: a plausible credentials file
+            # names an 'installed' or 'web' client, so anything else is
+            # rejected without a full JSON parse.
+            if b'"installed"' not in raw and b'"web"' not in raw:
+                print("Error: Invalid OAuth credentials file format.")
+                print("The file should contain 'installed' or 'web' application credentials.")
+                return None
+            data = _json_loads(raw)
+            if 'installed' not in data and 'web' not in data:
+                print("Error: Invalid OAuth credentials file format.")
+                print("The file should contain 'installed' or 'web' application credentials.")
+                return None
+            _parsed_cache[os.path.abspath(source_path)] = (
+                source.stat().st_mtime_ns, data
+            )
+        except ValueError:
             print("Error: Invalid JSON file.")
             return None
         except Exception as e:
@@ -232,7 +419,17 @@ class OAuthSetup:
         dest = Path(dest_path)
         
         try:
-            shutil.copy2(source, dest)
+            # Copy through a temp file and rename, so a crash mid-copy
+            # never leaves a half-written credentials file behind;
+            # copyfile keeps the kernel fast-copy path, and the rename
+            # is atomic on POSIX and Windows alike
+            tmp = dest.with_suffix('.tmp')
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, dest)
+            # The copy is byte-identical, so seed the parse cache for the
+            # destination and spare the validation pass a re-read
+            st = dest.stat()
+            _parsed_cache[os.path.abspath(dest_path)] = (st.st_mtime_ns, data)
             print(f"Credentials copied to: {dest_path}")
             return dest_path
         except Exception as e:
@@ -242,9 +439,9 @@ class OAuthSetup:
     def _get_credentials_file_path(self, account_name: str) -> Optional[str]:
         """Prompt user for downloaded credentials file path."""
         print("\nAfter downloading the credentials JSON file:")
-        print("Enter the path to the downloaded file (or drag & drop): ", end='')
-        
-        source_path = input().strip().strip('"').strip("'")
+        source_path = input(
+            "Enter the path to the downloaded file (or drag & drop): "
+        ).strip(_PATH_STRIP_CHARS)
         
         if not source_path:
             print("No file path provided.")
@@ -261,16 +458,16 @@ class OAuthSetup:
         print("[3] I already have a credentials.json file")
         print("[Q] Cancel")
         
-        print("\nSelection: ", end='')
-        choice = input().strip().upper()
+        choice = input("\nSelection: ").strip().upper()
         
         if choice == '1':
             return self.setup_with_console_guide(account_name, email)
         elif choice == '2':
             return self.setup_with_gcloud(account_name, email)
         elif choice == '3':
-            print("\nEnter path to existing credentials.json file: ", end='')
-            source_path = input().strip().strip('"').strip("'")
+            source_path = input(
+                "\nEnter path to existing credentials.json file: "
+            ).strip(_PATH_STRIP_CHARS)
             if source_path:
                 return self.setup_with_existing_file(account_name, source_path)
         elif choice == 'Q':
@@ -281,30 +478,44 @@ class OAuthSetup:
     
     def validate_and_test_credentials(self, credentials_path: str) -> bool:
         """Validate OAuth credentials file structure."""
-        creds_file = Path(credentials_path)
-
-        if not creds_file.exists():
+        # os.stat on the plain string skips a Path construction per call
+        try:
+            st = os.stat(credentials_path)
+        except OSError:
             print(f"Credentials file not found: {credentials_path}")
             return False
 
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _VALIDATE_CACHE.get(key)
+        if cached is not None:
+            if cached:
+                print("Credentials file is valid")
+            return cached
+
+        valid = self._parse_and_validate(credentials_path)
+        _VALIDATE_CACHE[key] = valid
+        return valid
+
+    @staticmethod
+    def _parse_and_validate(credentials_path: str) -> bool:
+        """Parse a credentials file and check its OAuth structure."""
         try:
-            data = json.loads(creds_file.read_text())
+            data = _load_credentials_json(credentials_path)
             app_data = data.get('installed') or data.get('web')
 
             if not app_data:
                 print("Invalid credentials format: missing 'installed' or 'web' section")
                 return False
 
-            required = ['client_id', 'client_secret', 'auth_uri', 'token_uri']
-            for field in required:
-                if field not in app_data:
-                    print(f"Invalid credentials: missing '{field}'")
-                    return False
+            missing = _REQUIRED_FIELDS - app_data.keys()
+            if missing:
+                print(f"Invalid credentials: missing {', '.join(sorted(missing))}")
+                return False
 
             print("Credentials file is valid")
             return True
 
-        except json.JSONDecodeError:
+        except ValueError:
             print("Invalid JSON in credentials file")
             return False
         except Exception as e:
@@ -317,12 +528,19 @@ def setup_oauth_for_account(account_name: str, email: str) -> bool:
     setup = OAuthSetup()
 
     # Check if credentials already exist
-    creds_path = Path(f'credentials/{account_name}_credentials.json')
-    if creds_path.exists():
-        print(f"\nCredentials already exist for account '{account_name}'")
-        print("Overwrite? [y/N]: ", end='')
-        if input().strip().lower() != 'y':
-            return False
+    creds_path = f'credentials/{account_name}_credentials.json'
+    if os.path.exists(creds_path):
+        if setup.validate_and_test_credentials(creds_path):
+            # Valid credentials make the whole interactive flow
+            # unnecessary - offer to reuse them and stop here
+            print(f"\nValid credentials already exist for account '{account_name}'")
+            if input("Reconfigure anyway? [y/N]: ").strip().lower() != 'y':
+                print(f"Reusing existing credentials: {creds_path}")
+                return True
+        else:
+            print(f"\nCredentials already exist for account '{account_name}'")
+            if input("Overwrite? [y/N]: ").strip().lower() != 'y':
+                return False
 
     result = setup.interactive_setup(account_name, email)
 